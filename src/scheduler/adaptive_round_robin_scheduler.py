@@ -0,0 +1,222 @@
+import math
+
+from scheduler.process import Process
+from scheduler.round_robin_scheduler import RoundRobinScheduler
+
+
+class AdaptiveRoundRobinScheduler(RoundRobinScheduler):
+    """
+    A Round Robin scheduler that picks the time quantum of each time slice when a process is dispatched, rather than
+    using a fixed time quantum. The time quantum is a fraction of the estimated burst length, which is exponentially
+    averaged over every finished process, multiplied by a feedback factor. Whenever the scheduler switches between
+    processes while other processes are waiting in the ready queue, the feedback factor is raised if switches have
+    recently been happening faster than the target switch rate and lowered if they have been happening slower.
+    Switches made while the ready queue is empty are not caused by the time quantum, so they are left out of the
+    feedback. Each adjustment takes constant time.
+    """
+    MAX_FEEDBACK_FACTOR = 16
+    """The largest feedback factor when there is no maximum time quantum, which stops the factor growing forever"""
+
+    def __init__(
+            self,
+            initial_burst_length: float = 3,
+            smoothing: float = 0.5,
+            burst_coverage: float = 0.8,
+            target_switch_rate: float = 0.5,
+            feedback_gain: float = 0.1,
+            min_time_quantum: int = 1,
+            max_time_quantum: int = None):
+        """
+            :param initial_burst_length:
+                The burst length estimate used before any process has finished.
+            :param smoothing:
+                The weight given to the latest observation when updating the burst length and switch interval
+                estimates, between 0 and 1.
+            :param burst_coverage:
+                The fraction of the estimated burst length that is allocated per time slice before feedback.
+            :param target_switch_rate:
+                The number of switches between processes per second that the feedback steers towards.
+            :param feedback_gain:
+                The relative amount that the feedback factor is raised or lowered by per switch.
+            :param min_time_quantum:
+                The shortest time quantum that may be used.
+            :param max_time_quantum:
+                The longest time quantum that may be used. Unbounded if None.
+        """
+        if not (math.isfinite(initial_burst_length) and initial_burst_length > 0):
+            raise ValueError("The initial burst length must be positive and finite. It was actually, {}.".format(
+                initial_burst_length
+            ))
+        if not 0 < smoothing <= 1:
+            raise ValueError("The smoothing must be between 0 and 1. It was actually, {}.".format(smoothing))
+        if not (math.isfinite(burst_coverage) and burst_coverage > 0):
+            raise ValueError("The burst coverage must be positive and finite. It was actually, {}.".format(
+                burst_coverage
+            ))
+        if not (math.isfinite(target_switch_rate) and target_switch_rate > 0):
+            raise ValueError("The target switch rate must be positive and finite. It was actually, {}.".format(
+                target_switch_rate
+            ))
+        if not (math.isfinite(feedback_gain) and feedback_gain >= 0):
+            raise ValueError("The feedback gain must be finite and not negative. It was actually, {}.".format(
+                feedback_gain
+            ))
+        if min_time_quantum < 1:
+            raise ValueError("The minimum time quantum must be at least 1. It was actually, {}.".format(
+                min_time_quantum
+            ))
+        if max_time_quantum is not None and max_time_quantum < min_time_quantum:
+            raise ValueError("The maximum time quantum {} is less than the minimum time quantum {}.".format(
+                max_time_quantum,
+                min_time_quantum
+            ))
+        self.__smoothing = smoothing
+        self.__burst_coverage = burst_coverage
+        self.__target_switch_rate = target_switch_rate
+        self.__feedback_gain = feedback_gain
+        self.__min_time_quantum = min_time_quantum
+        self.__max_time_quantum = max_time_quantum
+        self.__estimated_burst_length = initial_burst_length
+        """The exponentially averaged amount of time that processes execute for"""
+        self.__estimated_switch_interval = 1 / target_switch_rate
+        """The exponentially averaged amount of time between two switches"""
+        self.__feedback_factor = 1.0
+        """The multiplier applied to the burst based time quantum by the switch rate feedback"""
+        self.__last_dispatched_process = None
+        self.__last_switch_time = None
+        self.__switch_count = 0
+        """The number of times that a different process to the previous one was dispatched"""
+        self.__time_slice_count = 0
+        """The number of time slices that have been started"""
+        self.__total_time_quantum = 0
+        """The sum of the time quantum of every time slice that has been started"""
+        initial_time_quantum = self.__calculate_time_quantum()
+        super().__init__(initial_time_quantum)
+        self.__time_quantum_history = [(0, initial_time_quantum)]
+        """The elapsed time and new time quantum of every change to the time quantum"""
+
+    @property
+    def estimated_burst_length(self) -> float:
+        """
+            :return:
+                The exponentially averaged amount of time that finished processes executed for.
+        """
+        return self.__estimated_burst_length
+
+    @property
+    def time_quantum_history(self) -> list:
+        """
+            :return:
+                A list of (elapsed time, time quantum) pairs, one for each time the time quantum changed, starting
+                with the initial time quantum.
+        """
+        return self.__time_quantum_history
+
+    @property
+    def feedback_factor(self) -> float:
+        """
+            :return:
+                The multiplier currently applied to the burst based time quantum by the switch rate feedback.
+        """
+        return self.__feedback_factor
+
+    @property
+    def switch_count(self) -> int:
+        """
+            :return:
+                The number of times that a different process to the previously executed one was dispatched.
+        """
+        return self.__switch_count
+
+    @property
+    def time_slice_count(self) -> int:
+        """
+            :return:
+                The number of time slices that have been started, including a process being given another time slice
+                straight after its previous one.
+        """
+        return self.__time_slice_count
+
+    @property
+    def switch_rate(self) -> float:
+        """
+            :return:
+                The number of switches between processes per second of elapsed time.
+        """
+        return self.__switch_count / self.time_elapsed if self.time_elapsed > 0 else 0
+
+    @property
+    def average_time_quantum(self) -> float:
+        """
+            :return:
+                The average time quantum over every time slice that has been started.
+        """
+        if self.__time_slice_count == 0:
+            return self.time_quantum
+        return self.__total_time_quantum / self.__time_slice_count
+
+    def enqueue_process(self, process: Process):
+        process.register_on_finished_listener(self.__on_process_finished)
+        super(AdaptiveRoundRobinScheduler, self).enqueue_process(process)
+
+    def __on_process_finished(self, finished_process: Process):
+        """
+        Updates the burst length estimate with the execution time of the finished process.
+            :param finished_process:
+                The process that finished.
+        """
+        self.__estimated_burst_length += self.__smoothing * (
+            finished_process.total_time_to_process - self.__estimated_burst_length
+        )
+
+    def __calculate_time_quantum(self) -> int:
+        """
+            :return:
+                The time quantum for the current burst length estimate and feedback factor, within the time quantum
+                bounds.
+        """
+        time_quantum = max(self.__min_time_quantum, round(
+            self.__feedback_factor * self.__burst_coverage * self.__estimated_burst_length
+        ))
+        if self.__max_time_quantum is not None:
+            time_quantum = min(time_quantum, self.__max_time_quantum)
+        return time_quantum
+
+    def __update_feedback_factor(self, switch_time: int):
+        """
+        Updates the switch interval estimate and moves the feedback factor towards the target switch rate.
+            :param switch_time:
+                The elapsed simulation time at which the switch happened.
+        """
+        if self.__last_switch_time is not None:
+            self.__estimated_switch_interval += self.__smoothing * (
+                switch_time - self.__last_switch_time - self.__estimated_switch_interval
+            )
+        self.__last_switch_time = switch_time
+        if len(self._ready_queue) == 0:
+            # Nothing else is waiting, so the time quantum has no say in how often switches happen
+            return
+        if self.__estimated_switch_interval * self.__target_switch_rate < 1:
+            self.__feedback_factor *= 1 + self.__feedback_gain
+        else:
+            self.__feedback_factor /= 1 + self.__feedback_gain
+        # Keep the factor within the range that can change the time quantum so that it recovers quickly
+        burst_time_quantum = self.__burst_coverage * self.__estimated_burst_length
+        max_factor = self.MAX_FEEDBACK_FACTOR
+        if self.__max_time_quantum is not None:
+            max_factor = self.__max_time_quantum / burst_time_quantum
+        min_factor = self.__min_time_quantum / burst_time_quantum
+        self.__feedback_factor = max(min_factor, min(max_factor, self.__feedback_factor))
+
+    def _on_process_dispatched(self, process: Process, dispatch_time: int):
+        if process is not self.__last_dispatched_process:
+            self.__switch_count += 1
+            self.__last_dispatched_process = process
+            self.__update_feedback_factor(dispatch_time)
+        time_quantum = self.__calculate_time_quantum()
+        if time_quantum != self.time_quantum:
+            self._set_time_quantum(time_quantum)
+            self.__time_quantum_history.append((dispatch_time, time_quantum))
+        self.reset_current_time_slice()
+        self.__time_slice_count += 1
+        self.__total_time_quantum += time_quantum
@@ -0,0 +1,393 @@
+"""
+The command line entry point of the simulator. Simulates one or more process information files with a chosen scheduler.
+Modules are only imported once they are needed so that the command starts up quickly.
+"""
+import sys
+
+SCHEDULERS = {
+    "fcfs": ("scheduler.fcfs_scheduler", "FirstComeFirstServedScheduler"),
+    "rr": ("scheduler.round_robin_scheduler", "RoundRobinScheduler"),
+    "adaptive-rr": ("scheduler.adaptive_round_robin_scheduler", "AdaptiveRoundRobinScheduler"),
+    "srt": ("scheduler.srt_scheduler", "ShortestRemainingTimeScheduler"),
+}
+"""The module and class name of each scheduler, keyed by the name used on the command line"""
+
+SCHEDULER_ARGUMENTS = {
+    "rr": ("time_quantum",),
+    "adaptive-rr": (
+        "initial_burst_length",
+        "smoothing",
+        "burst_coverage",
+        "target_switch_rate",
+        "feedback_gain",
+        "min_time_quantum",
+        "max_time_quantum",
+    ),
+}
+"""The command line options accepted by each scheduler, named after the scheduler's keyword arguments"""
+
+SCHEDULER_OPTIONS = SCHEDULER_ARGUMENTS["rr"] + SCHEDULER_ARGUMENTS["adaptive-rr"]
+"""Every command line option that is passed on to a scheduler"""
+
+INPUT_FORMATS = ("text", "csv", "json")
+OUTPUT_FORMATS = ("report", "csv", "jsonl")
+ENGINES = ("realtime", "immediate")
+
+SUMMARY_FIELDS = ("trace", "scheduler", "average_turnaround_time", "average_waiting_time", "throughput")
+"""The fields outputted per trace by the csv and jsonl output formats, besides the scheduler arguments"""
+
+TIME_QUANTUM_FIELDS = ("average_time_quantum", "switch_count", "time_quantum_history")
+"""The fields outputted for schedulers that adjust their time quantum at runtime"""
+
+
+def positive_int(value: str) -> int:
+    """
+    Parses a command line option that must be a whole number of at least 1.
+        :param value:
+            The option's value.
+        :return:
+            The parsed value.
+    """
+    import argparse
+    try:
+        parsed_value = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError("{} is not a whole number".format(value))
+    if parsed_value < 1:
+        raise argparse.ArgumentTypeError("{} must be at least 1".format(value))
+    return parsed_value
+
+
+def finite_float(value: str) -> float:
+    """
+    Parses a command line option that must be a finite number.
+        :param value:
+            The option's value.
+        :return:
+            The parsed value.
+    """
+    import argparse
+    import math
+    try:
+        parsed_value = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError("{} is not a number".format(value))
+    if not math.isfinite(parsed_value):
+        raise argparse.ArgumentTypeError("{} must be finite".format(value))
+    return parsed_value
+
+
+def positive_float(value: str) -> float:
+    """
+    Parses a command line option that must be a finite number greater than 0.
+        :param value:
+            The option's value.
+        :return:
+            The parsed value.
+    """
+    import argparse
+    parsed_value = finite_float(value)
+    if parsed_value <= 0:
+        raise argparse.ArgumentTypeError("{} must be greater than 0".format(value))
+    return parsed_value
+
+
+def non_negative_float(value: str) -> float:
+    """
+    Parses a command line option that must be a finite number of at least 0.
+        :param value:
+            The option's value.
+        :return:
+            The parsed value.
+    """
+    import argparse
+    parsed_value = finite_float(value)
+    if parsed_value < 0:
+        raise argparse.ArgumentTypeError("{} must not be negative".format(value))
+    return parsed_value
+
+
+def create_argument_parser():
+    """
+        :return:
+            The parser for the simulator's command line arguments.
+    """
+    import argparse
+    parser = argparse.ArgumentParser(
+        prog="scheduling-simulator",
+        description="Simulates processes being executed by a scheduler. Each trace file is simulated separately."
+    )
+    parser.add_argument("traces", nargs="+", metavar="TRACE", help="paths of the process information files")
+    parser.add_argument("-s", "--scheduler", choices=sorted(SCHEDULERS), default="fcfs",
+                        help="the scheduler algorithm (default: fcfs)")
+    parser.add_argument("-q", "--time-quantum", type=positive_int,
+                        help="the time quantum of rr. adaptive-rr picks its own time quantum on every dispatch")
+    parser.add_argument("--initial-burst-length", type=positive_float,
+                        help="adaptive-rr burst length estimate before any process finishes")
+    parser.add_argument("--smoothing", type=positive_float,
+                        help="adaptive-rr weight of the latest burst length and switch interval")
+    parser.add_argument("--burst-coverage", type=positive_float,
+                        help="adaptive-rr fraction of the estimated burst length per time slice")
+    parser.add_argument("--target-switch-rate", type=positive_float,
+                        help="adaptive-rr switches between processes per second to steer towards")
+    parser.add_argument("--feedback-gain", type=non_negative_float,
+                        help="adaptive-rr relative change of the time quantum per switch")
+    parser.add_argument("--min-time-quantum", type=positive_int, help="adaptive-rr shortest time quantum")
+    parser.add_argument("--max-time-quantum", type=positive_int, help="adaptive-rr longest time quantum")
+    parser.add_argument("-f", "--input-format", choices=INPUT_FORMATS, default="text",
+                        help="text: '<PID> <arrival-time> <processing-time>' per line, "
+                             "csv: the same three columns with an optional header, "
+                             "json: a list of objects with pid, arrival_time and processing_time (default: text)")
+    parser.add_argument("-o", "--output", default="-", help="the file to write the output to (default: stdout)")
+    parser.add_argument("-F", "--output-format", choices=OUTPUT_FORMATS, default="report",
+                        help="report: the information of each process as it finishes, "
+                             "csv/jsonl: a single summary per trace (default: report)")
+    parser.add_argument("-e", "--engine", choices=ENGINES, default="realtime",
+                        help="realtime: wait for as many seconds as each process executes for, "
+                             "immediate: output everything straight away (default: realtime)")
+    parser.add_argument("-i", dest="engine", action="store_const", const="immediate",
+                        help="shorthand for --engine immediate")
+    parser.add_argument("-d", "--debug", action="store_true", help="print debugging information")
+    return parser
+
+
+def get_scheduler_type(name: str) -> type:
+    """
+    Imports a scheduler class.
+        :param name:
+            The command line name of the scheduler.
+        :return:
+            The scheduler class.
+    """
+    from importlib import import_module
+    module_name, class_name = SCHEDULERS[name]
+    return getattr(import_module(module_name), class_name)
+
+
+def create_scheduler(name: str, scheduler_arguments: dict):
+    """
+    Imports and instantiates a scheduler.
+        :param name:
+            The command line name of the scheduler.
+        :param scheduler_arguments:
+            The keyword arguments that the scheduler is instantiated with.
+        :return:
+            The new scheduler.
+    """
+    return get_scheduler_type(name)(**scheduler_arguments)
+
+
+def get_effective_scheduler_arguments(name: str, scheduler_arguments: dict) -> dict:
+    """
+    Fills in the default value of every scheduler option that was not given on the command line.
+        :param name:
+            The command line name of the scheduler.
+        :param scheduler_arguments:
+            The keyword arguments given on the command line.
+        :return:
+            The value of every keyword argument accepted by the scheduler, keyed by the option name.
+    """
+    # Read from the code object rather than through inspect, which is slow to import
+    constructor = get_scheduler_type(name).__init__
+    parameter_names = constructor.__code__.co_varnames[1:constructor.__code__.co_argcount]
+    defaults = constructor.__defaults__ or ()
+    effective_arguments = dict(zip(parameter_names[len(parameter_names) - len(defaults):], defaults))
+    effective_arguments.update(scheduler_arguments)
+    return {option: effective_arguments.get(option) for option in SCHEDULER_ARGUMENTS.get(name, ())}
+
+
+def has_time_quantum_history(scheduler_type: type) -> bool:
+    """
+        :param scheduler_type:
+            The scheduler class.
+        :return:
+            Whether the scheduler adjusts its time quantum at runtime and records how it evolved.
+    """
+    return hasattr(scheduler_type, "time_quantum_history")
+
+
+def get_csv_columns(name: str) -> tuple:
+    """
+        :param name:
+            The command line name of the scheduler.
+        :return:
+            The columns of the csv output format, with a column for each option accepted by the scheduler and the
+            time quantum fields if the scheduler records them.
+    """
+    columns = SUMMARY_FIELDS[:2] + SCHEDULER_ARGUMENTS.get(name, ()) + SUMMARY_FIELDS[2:]
+    if has_time_quantum_history(get_scheduler_type(name)):
+        columns += TIME_QUANTUM_FIELDS
+    return columns
+
+
+def print_time_quantum_history(scheduler):
+    """
+    Prints how the time quantum of the scheduler evolved over the simulation, at the end of the report.
+        :param scheduler:
+            The scheduler that was used in the simulation.
+    """
+    print("Average time quantum: \t\t{} seconds".format(scheduler.average_time_quantum))
+    print("Switch count: \t\t\t\t{}".format(scheduler.switch_count))
+    print("Time quantum history: \t\t{}".format(scheduler.time_quantum_history))
+
+
+def get_scheduler_arguments(parser, arguments) -> dict:
+    """
+    Collects the scheduler options given on the command line, rejecting options that the scheduler does not accept.
+        :param parser:
+            The parser used to report invalid options.
+        :param arguments:
+            The parsed command line arguments.
+        :return:
+            The keyword arguments that the scheduler is instantiated with.
+    """
+    accepted_options = SCHEDULER_ARGUMENTS.get(arguments.scheduler, ())
+    scheduler_arguments = {}
+    for option in SCHEDULER_OPTIONS:
+        value = getattr(arguments, option)
+        if value is None:
+            continue
+        if option not in accepted_options:
+            parser.error("--{} is not accepted by the {} scheduler".format(
+                option.replace("_", "-"),
+                arguments.scheduler
+            ))
+        scheduler_arguments[option] = value
+    return scheduler_arguments
+
+
+def load_process_info_data(path: str, input_format: str) -> list:
+    """
+    Reads and parses a process information file.
+        :param path:
+            The path of the file.
+        :param input_format:
+            The format of the file, one of INPUT_FORMATS.
+        :return:
+            The parsed process information data.
+    """
+    from scheduler.process import ProcessInfo
+    with open(path, newline="") as fs:
+        if input_format == "json":
+            import json
+            return [
+                ProcessInfo(str(item["pid"]), int(item["arrival_time"]), int(item["processing_time"]))
+                for item in json.load(fs)
+            ]
+        if input_format == "csv":
+            import csv
+            rows = [row for row in csv.reader(fs) if row]
+            if rows and not rows[0][1].strip().isdigit():
+                # Skip the header
+                rows = rows[1:]
+            return [ProcessInfo(row[0].strip(), int(row[1]), int(row[2])) for row in rows]
+        from scheduler.simulate import parse_process_info_data
+        return parse_process_info_data([line for line in fs if line.strip()])
+
+
+def simulate_trace(trace: str, process_info_data: list, scheduler, scheduler_arguments: dict, arguments, output):
+    """
+    Simulates a single trace and writes its results to the output.
+        :param trace:
+            The path of the trace, used to label its summary.
+        :param process_info_data:
+            The process information of the trace.
+        :param scheduler:
+            The scheduler used in the simulation.
+        :param scheduler_arguments:
+            The effective arguments of the scheduler, recorded in the summary.
+        :param arguments:
+            The parsed command line arguments.
+        :param output:
+            The stream that the results are written to.
+    """
+    from contextlib import redirect_stdout
+    from scheduler import simulate
+    is_immediate = arguments.engine == "immediate"
+    if arguments.output_format == "report":
+        with redirect_stdout(output):
+            simulate.simulate_from_process_info(process_info_data, scheduler, is_immediate, arguments.debug)
+            if has_time_quantum_history(type(scheduler)):
+                print_time_quantum_history(scheduler)
+        return
+    processes = simulate.create_simulation_processes(process_info_data)
+    if not is_immediate:
+        simulate.bind_real_time_delays(processes)
+    # Debugging output is kept out of the summary so that the summary can still be parsed
+    with redirect_stdout(sys.stderr):
+        if arguments.debug:
+            simulate.bind_debugging_output(processes, scheduler)
+        aggregates = simulate.simulate_aggregates(processes, scheduler)
+    summary = {
+        "trace": trace,
+        "scheduler": arguments.scheduler,
+        "scheduler_arguments": scheduler_arguments,
+        "average_turnaround_time": aggregates.average_turnaround_time,
+        "average_waiting_time": aggregates.average_waiting_time,
+        "throughput": aggregates.throughput,
+    }
+    if has_time_quantum_history(type(scheduler)):
+        for field in TIME_QUANTUM_FIELDS:
+            summary[field] = getattr(scheduler, field)
+    if arguments.output_format == "csv":
+        import csv
+        import json
+        row = dict(summary, **scheduler_arguments)
+        if "time_quantum_history" in row:
+            row["time_quantum_history"] = json.dumps(row["time_quantum_history"])
+        columns = get_csv_columns(arguments.scheduler)
+        csv.writer(output, lineterminator="\n").writerow([row[column] for column in columns])
+    else:
+        import json
+        output.write(json.dumps(summary) + "\n")
+    output.flush()
+
+
+def main(argv: list = None) -> int:
+    """
+    Runs the simulator from the command line.
+        :param argv:
+            The command line arguments, excluding the program name. Defaults to sys.argv[1:].
+        :return:
+            The exit status: 0 if every trace was simulated, otherwise 1.
+    """
+    parser = create_argument_parser()
+    arguments = parser.parse_args(argv)
+    scheduler_arguments = get_scheduler_arguments(parser, arguments)
+    try:
+        # Catches invalid combinations of options, e.g. a minimum time quantum above the maximum, before any output
+        create_scheduler(arguments.scheduler, scheduler_arguments)
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        output = sys.stdout if arguments.output == "-" else open(arguments.output, "w", newline="")
+    except OSError as e:
+        parser.error("{} could not be opened for writing: {}".format(arguments.output, e.strerror))
+    exit_status = 0
+    try:
+        if arguments.output_format == "csv":
+            output.write(",".join(get_csv_columns(arguments.scheduler)) + "\n")
+        effective_scheduler_arguments = get_effective_scheduler_arguments(arguments.scheduler, scheduler_arguments)
+        for trace in arguments.traces:
+            try:
+                process_info_data = load_process_info_data(trace, arguments.input_format)
+            except OSError:
+                print("{} was an invalid file path.".format(trace), file=sys.stderr)
+                exit_status = 1
+                continue
+            except (ValueError, IndexError, KeyError, TypeError) as e:
+                print("{} could not be parsed as {}: {}".format(trace, arguments.input_format, e), file=sys.stderr)
+                exit_status = 1
+                continue
+            if arguments.output_format == "report" and len(arguments.traces) > 1:
+                output.write("==> {} <==\n".format(trace))
+            scheduler = create_scheduler(arguments.scheduler, scheduler_arguments)
+            simulate_trace(trace, process_info_data, scheduler, effective_scheduler_arguments, arguments, output)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return exit_status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,8 +9,10 @@ class RoundRobinScheduler(Scheduler):
     def __init__(self, time_quantum=2):
         """
             :param time_quantum:
-                The amount of time that will be allocated to each process for a given time slice.
+                The amount of time that will be allocated to each process for a given time slice. Must be at least 1.
         """
+        if time_quantum < 1:
+            raise ValueError("The time quantum must be at least 1. It was actually, {}.".format(time_quantum))
         super().__init__()
         self.__time_quantum = time_quantum
         """The amount of time given to each time slice"""
@@ -25,6 +27,26 @@ class RoundRobinScheduler(Scheduler):
         """
         return self.__time_quantum
 
+    def _set_time_quantum(self, time_quantum: int):
+        """
+        Changes the time quantum used by subsequent time slices. The current time slice is left untouched until it is
+        reset.
+            :param time_quantum:
+                The amount of time that will be allocated to each process for a given time slice.
+        """
+        self.__time_quantum = time_quantum
+
+    def _on_process_dispatched(self, process, dispatch_time: int):
+        """
+        Called whenever a process is taken off the ready queue and starts its time slice. Does nothing by default;
+        subclasses may override this to adjust the time quantum.
+            :param process:
+                The process that was dispatched.
+            :param dispatch_time:
+                The elapsed simulation time at which the process was dispatched.
+        """
+        pass
+
     def reset_current_time_slice(self):
         """
         Resets the remaining time left on the time slice, back to the time quantum. Note that this should only be
@@ -43,6 +65,7 @@ class RoundRobinScheduler(Scheduler):
             if self._executing_process is None and len(self._ready_queue) > 0:
                 # If we don't have any processes
                 self._executing_process = self._ready_queue.popleft()
+                self._on_process_dispatched(self._executing_process, self._time_elapsed - time)
             if self._executing_process is not None:
                 # Figure out how much time we can allocate to the process
                 allocated_time = min(self.__time_left_for_time_slice, time)
@@ -1,10 +1,6 @@
 from time import sleep
 from typing import List
 
-from scheduler.fcfs_scheduler import FirstComeFirstServedScheduler
-from scheduler.round_robin_scheduler import RoundRobinScheduler
-from scheduler.srt_scheduler import ShortestRemainingTimeScheduler
-
 from scheduler.scheduler import Scheduler
 from scheduler.process import Process
 from scheduler.process import ProcessInfo
@@ -24,6 +20,20 @@ class SimulationProcessingInformation:
         """The number of processes to be processed"""
 
 
+class SimulationAggregates:
+    """
+    The averaged results of a finished simulation.
+    """
+
+    def __init__(self, average_turnaround_time: float, average_waiting_time: float, throughput: float):
+        self.average_turnaround_time = average_turnaround_time
+        """The average time between a process being enqueued and the process finishing"""
+        self.average_waiting_time = average_waiting_time
+        """The average time that a process spent waiting in the ready queue"""
+        self.throughput = throughput
+        """The number of processes finished per second"""
+
+
 def create_simulation_processes(process_info_data: List[ProcessInfo]) -> List[Process]:
     """
     Creates a list of simulated processes, for use in a scheduler simulation.
@@ -89,6 +99,20 @@ def bind_debugging_output(processes: List[Process] = list(), scheduler: Schedule
         )
 
 
+def bind_real_time_delays(processes: List[Process]):
+    """
+    Binds listeners that wait for as many seconds as each process executes for, so that the simulation runs in real
+    time.
+        :param processes:
+            The processes being bound.
+    """
+    for process in processes:
+        process.register_on_executed_listener(
+            lambda executed_process, allocated_time, executed_time:
+            sleep(executed_time)
+        )
+
+
 def on_process_finished(
         finished_process: Process,
         scheduler: Scheduler,
@@ -136,11 +160,7 @@ def simulate(
             Whether to print out debugging information such as how long and which processes are being executed.
     """
     if not immediately_output_information:
-        for process in processes:
-            process.register_on_executed_listener(
-                lambda executed_process, allocated_time, executed_time:
-                sleep(executed_time)
-            )
+        bind_real_time_delays(processes)
     if is_debug_output_enabled:
         bind_debugging_output(processes, scheduler)
     simulation_info = SimulationProcessingInformation(len(processes))
@@ -149,6 +169,18 @@ def simulate(
             lambda finished_process:
             on_process_finished(finished_process, scheduler, simulation_info)
         )
+    run_simulation(processes, scheduler)
+
+
+def run_simulation(processes: List[Process], scheduler: Scheduler):
+    """
+    Enqueues each process into the scheduler as it arrives and then runs the scheduler until all processes finish.
+    No listeners are bound, so nothing is outputted unless the caller has registered listeners beforehand.
+        :param processes:
+            The processes used in the simulation, ordered by their arrival time
+        :param scheduler:
+            The scheduler used to execute the processes
+    """
     for process in processes:
         time_till_process_arrives = max(0, process.process_info.arrival_time - scheduler.time_elapsed)
         scheduler.increase_time(time_till_process_arrives)
@@ -156,6 +188,33 @@ def simulate(
     scheduler.finish()
 
 
+def simulate_aggregates(processes: List[Process], scheduler: Scheduler) -> SimulationAggregates:
+    """
+    Silently simulates the processes and collects the averaged results of the simulation.
+        :param processes:
+            The processes used in the simulation, ordered by their arrival time
+        :param scheduler:
+            The scheduler used to execute the processes
+        :return:
+            The average turnaround time, average waiting time and throughput of the simulation.
+    """
+    finished_processes = []
+    for process in processes:
+        process.register_on_finished_listener(finished_processes.append)
+    run_simulation(processes, scheduler)
+    process_count = len(finished_processes)
+    if process_count == 0:
+        return SimulationAggregates(0, 0, 0)
+    total_turnaround_time = sum(process.turnaround_time for process in finished_processes)
+    total_waiting_time = sum(process.waiting_time for process in finished_processes)
+    throughput = process_count / scheduler.time_elapsed if scheduler.time_elapsed > 0 else 0
+    return SimulationAggregates(
+        total_turnaround_time / process_count,
+        total_waiting_time / process_count,
+        throughput
+    )
+
+
 def parse_process_info(process_info_string: str) -> ProcessInfo:
     """
     Parses a string and creates process information to be used in a scheduler simulation.
@@ -188,6 +247,11 @@ def parse_process_info_data(process_info_lines: List[str]) -> List[ProcessInfo]:
     Below are examples simulations of all examples in lecture 9 of FIT2070.
 """
 if __name__ == "__main__":
+    from scheduler.fcfs_scheduler import FirstComeFirstServedScheduler
+    from scheduler.adaptive_round_robin_scheduler import AdaptiveRoundRobinScheduler
+    from scheduler.round_robin_scheduler import RoundRobinScheduler
+    from scheduler.srt_scheduler import ShortestRemainingTimeScheduler
+
     example_process_information = [
             ProcessInfo("A", 0, 3),
             ProcessInfo("B", 2, 6),
@@ -222,6 +286,17 @@ if __name__ == "__main__":
     )
     print()
 
+    print("Adaptive round robin")
+    adaptive_round_robin_scheduler = AdaptiveRoundRobinScheduler()
+    simulate_from_process_info(
+        example_process_information,
+        adaptive_round_robin_scheduler,
+        True,
+        True
+    )
+    print("Time quantum history: {}".format(adaptive_round_robin_scheduler.time_quantum_history))
+    print()
+
     print("Shortest remaining time scheduler")
     simulate_from_process_info(
         example_process_information,
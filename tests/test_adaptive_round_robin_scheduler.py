@@ -0,0 +1,72 @@
+import pytest
+
+from scheduler.adaptive_round_robin_scheduler import AdaptiveRoundRobinScheduler
+from scheduler.ensemble import WorkloadParameters, generate_process_info_data
+from scheduler.process import ProcessInfo
+from scheduler.simulate import create_simulation_processes, simulate_aggregates
+
+OVERLOADED_WORKLOAD = WorkloadParameters(process_count=30, mean_inter_arrival_time=3, mean_processing_time=5)
+
+
+def simulate_replica(scheduler: AdaptiveRoundRobinScheduler, seed: int = 0):
+    processes = create_simulation_processes(generate_process_info_data(seed, OVERLOADED_WORKLOAD))
+    return simulate_aggregates(processes, scheduler)
+
+
+def test_time_quantum_stays_within_bounds():
+    scheduler = AdaptiveRoundRobinScheduler(min_time_quantum=2, max_time_quantum=3, target_switch_rate=2)
+    simulate_replica(scheduler)
+    assert all(2 <= time_quantum <= 3 for _, time_quantum in scheduler.time_quantum_history)
+    assert 2 <= scheduler.average_time_quantum <= 3
+
+
+def test_time_quantum_history_records_changes():
+    scheduler = AdaptiveRoundRobinScheduler(initial_burst_length=5)
+    assert scheduler.time_quantum_history == [(0, 4)]
+    simulate_replica(scheduler)
+    history = scheduler.time_quantum_history
+    assert len(history) > 1
+    times = [time for time, _ in history]
+    assert times == sorted(times)
+    assert all(previous[1] != current[1] for previous, current in zip(history, history[1:]))
+    assert history[-1][1] == scheduler.time_quantum
+
+
+def test_lone_process_is_not_counted_as_switching():
+    scheduler = AdaptiveRoundRobinScheduler(initial_burst_length=1, max_time_quantum=1)
+    simulate_aggregates(create_simulation_processes([ProcessInfo("A", 0, 10)]), scheduler)
+    assert scheduler.switch_count == 1
+    assert scheduler.time_slice_count == 10
+    assert scheduler.switch_rate == 0.1
+
+
+def test_higher_target_switch_rate_gives_shorter_time_quantum():
+    frequent_scheduler = AdaptiveRoundRobinScheduler(target_switch_rate=2)
+    infrequent_scheduler = AdaptiveRoundRobinScheduler(target_switch_rate=0.1)
+    simulate_replica(frequent_scheduler)
+    simulate_replica(infrequent_scheduler)
+    assert frequent_scheduler.average_time_quantum < infrequent_scheduler.average_time_quantum
+    assert frequent_scheduler.switch_rate > infrequent_scheduler.switch_rate
+
+
+def test_time_quantum_does_not_stay_at_minimum_under_load():
+    scheduler = AdaptiveRoundRobinScheduler()
+    simulate_replica(scheduler)
+    assert scheduler.average_time_quantum > 2
+    assert scheduler.switch_count < scheduler.time_slice_count
+
+
+@pytest.mark.parametrize("arguments", [
+    {"min_time_quantum": 0},
+    {"max_time_quantum": 0},
+    {"min_time_quantum": 3, "max_time_quantum": 2},
+    {"target_switch_rate": 0},
+    {"smoothing": 1.5},
+    {"initial_burst_length": -1},
+    {"initial_burst_length": float("inf")},
+    {"burst_coverage": float("inf")},
+    {"feedback_gain": float("nan")},
+])
+def test_invalid_arguments_are_rejected(arguments):
+    with pytest.raises(ValueError):
+        AdaptiveRoundRobinScheduler(**arguments)
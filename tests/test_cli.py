@@ -0,0 +1,139 @@
+import csv
+import json
+
+import pytest
+
+from scheduler.cli import main
+
+TRACE = "P1 0 3\nP2 1 6\nP3 4 4\nP4 6 2\n"
+
+
+@pytest.fixture
+def trace_path(tmp_path):
+    path = tmp_path / "processes.txt"
+    path.write_text(TRACE)
+    return path
+
+
+def test_csv_batch_output(trace_path, tmp_path, capsys):
+    other_trace_path = tmp_path / "other.txt"
+    other_trace_path.write_text("A 0 2\n\nB 0 2\n")
+    exit_status = main(["-s", "rr", "-q", "2", "-i", "-F", "csv", str(trace_path), str(other_trace_path)])
+    assert exit_status == 0
+    rows = list(csv.DictReader(capsys.readouterr().out.splitlines()))
+    assert [row["trace"] for row in rows] == [str(trace_path), str(other_trace_path)]
+    assert all(row["scheduler"] == "rr" for row in rows)
+    assert float(rows[0]["average_waiting_time"]) == 4.5
+    assert float(rows[1]["average_turnaround_time"]) == 3.0
+
+
+def test_jsonl_output_to_file(trace_path, tmp_path):
+    output_path = tmp_path / "summary.jsonl"
+    assert main(["-s", "srt", "-i", "-F", "jsonl", "-o", str(output_path), str(trace_path)]) == 0
+    summaries = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert summaries == [{
+        "trace": str(trace_path),
+        "scheduler": "srt",
+        "scheduler_arguments": {},
+        "average_turnaround_time": 6.25,
+        "average_waiting_time": 2.5,
+        "throughput": 4 / 15,
+    }]
+
+
+def test_summaries_record_scheduler_arguments(trace_path, capsys):
+    assert main(["-s", "rr", "-q", "8", "-i", "-F", "csv", str(trace_path)]) == 0
+    assert main(["-s", "rr", "-i", "-F", "csv", str(trace_path)]) == 0
+    rows = [row for row in csv.DictReader(capsys.readouterr().out.splitlines()) if row["trace"] != "trace"]
+    assert [row["time_quantum"] for row in rows] == ["8", "2"]
+    assert main(["-s", "adaptive-rr", "--max-time-quantum", "4", "-i", "-F", "jsonl", str(trace_path)]) == 0
+    scheduler_arguments = json.loads(capsys.readouterr().out)["scheduler_arguments"]
+    assert scheduler_arguments["max_time_quantum"] == 4
+    assert scheduler_arguments["min_time_quantum"] == 1
+
+
+def test_report_labels_each_trace_in_batch(trace_path, capsys):
+    assert main(["-i", str(trace_path), str(trace_path)]) == 0
+    output = capsys.readouterr().out
+    assert output.count("==> {} <==".format(trace_path)) == 2
+    assert output.count("Average waiting time:") == 2
+
+
+def test_missing_trace_does_not_stop_batch(trace_path, tmp_path, capsys):
+    missing_path = tmp_path / "missing.txt"
+    exit_status = main(["-i", "-F", "csv", str(missing_path), str(trace_path)])
+    assert exit_status == 1
+    captured = capsys.readouterr()
+    assert "{} was an invalid file path.".format(missing_path) in captured.err
+    assert len(captured.out.splitlines()) == 2
+
+
+def test_unwritable_output_is_reported(trace_path, tmp_path, capsys):
+    output_path = tmp_path / "missing" / "summary.csv"
+    with pytest.raises(SystemExit) as exit_info:
+        main(["-i", "-F", "csv", "-o", str(output_path), str(trace_path)])
+    assert exit_info.value.code == 2
+    assert "{} could not be opened for writing".format(output_path) in capsys.readouterr().err
+
+
+def test_unparsable_trace_is_reported(tmp_path, capsys):
+    bad_trace_path = tmp_path / "bad.txt"
+    bad_trace_path.write_text("P1 zero 3\n")
+    assert main(["-i", str(bad_trace_path)]) == 1
+    assert "could not be parsed as text" in capsys.readouterr().err
+
+
+def test_csv_and_json_input_formats(tmp_path, capsys):
+    csv_path = tmp_path / "processes.csv"
+    csv_path.write_text("pid,arrival_time,processing_time\nP1,0,3\nP2,1,6\n")
+    json_path = tmp_path / "processes.json"
+    json_path.write_text(json.dumps([
+        {"pid": "P1", "arrival_time": 0, "processing_time": 3},
+        {"pid": "P2", "arrival_time": 1, "processing_time": 6},
+    ]))
+    assert main(["-i", "-F", "jsonl", "-f", "csv", str(csv_path)]) == 0
+    assert main(["-i", "-F", "jsonl", "-f", "json", str(json_path)]) == 0
+    csv_summary, json_summary = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    del csv_summary["trace"], json_summary["trace"]
+    assert csv_summary == json_summary
+    assert csv_summary["average_waiting_time"] == 1.0
+
+
+@pytest.mark.parametrize("arguments", [
+    ["-s", "rr", "-q", "0"],
+    ["-s", "rr", "-q", "-2"],
+    ["-s", "adaptive-rr", "--max-time-quantum", "0"],
+    ["-s", "adaptive-rr", "--min-time-quantum", "3", "--max-time-quantum", "2"],
+    ["-s", "adaptive-rr", "-q", "3"],
+    ["-s", "fcfs", "-q", "3"],
+    ["-s", "adaptive-rr", "--burst-coverage", "inf"],
+    ["-s", "adaptive-rr", "--initial-burst-length", "inf"],
+    ["-s", "adaptive-rr", "--smoothing", "nan"],
+    ["-s", "adaptive-rr", "--feedback-gain", "nan"],
+    ["-s", "adaptive-rr", "--feedback-gain", "-0.5"],
+])
+def test_invalid_scheduler_options_are_rejected(arguments, trace_path, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(arguments + ["-i", str(trace_path)])
+    assert exit_info.value.code == 2
+    assert capsys.readouterr().out == ""
+
+
+def test_adaptive_scheduler_reports_time_quantum_history(trace_path, capsys):
+    assert main(["-s", "adaptive-rr", "-i", str(trace_path)]) == 0
+    report = capsys.readouterr().out
+    assert "Average time quantum:" in report
+    assert "Time quantum history: \t\t[(0, 2)" in report
+    assert main(["-s", "adaptive-rr", "-i", "-F", "jsonl", str(trace_path)]) == 0
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["time_quantum_history"][0] == [0, 2]
+    assert summary["switch_count"] >= len(TRACE.splitlines())
+    assert main(["-s", "adaptive-rr", "-i", "-F", "csv", str(trace_path)]) == 0
+    row, = csv.DictReader(capsys.readouterr().out.splitlines())
+    assert json.loads(row["time_quantum_history"]) == summary["time_quantum_history"]
+    assert float(row["average_time_quantum"]) == summary["average_time_quantum"]
+
+
+def test_fixed_quantum_scheduler_has_no_time_quantum_fields(trace_path, capsys):
+    assert main(["-s", "rr", "-i", "-F", "jsonl", str(trace_path)]) == 0
+    assert "time_quantum_history" not in json.loads(capsys.readouterr().out)
@@ -0,0 +1,85 @@
+import math
+import statistics
+
+from scheduler.ensemble import (
+    RunningStatistics,
+    WorkloadParameters,
+    generate_process_info_data,
+    run_ensemble,
+    student_t_quantile,
+)
+from scheduler.round_robin_scheduler import RoundRobinScheduler
+
+
+def test_running_statistics_match_statistics_module():
+    values = [3.5, 1.0, 7.25, 4.0, 4.0, 9.5, 0.5]
+    running_statistics = RunningStatistics()
+    for value in values:
+        running_statistics.add(value)
+    assert running_statistics.count == len(values)
+    assert math.isclose(running_statistics.mean, statistics.mean(values))
+    assert math.isclose(running_statistics.variance, statistics.variance(values))
+
+
+def test_confidence_interval_uses_student_t():
+    running_statistics = RunningStatistics()
+    for value in range(1, 11):
+        running_statistics.add(value)
+    interval = running_statistics.confidence_interval(0.95)
+    # t(0.975, 9) = 2.262
+    assert math.isclose(interval.half_width, 2.262 * statistics.stdev(range(1, 11)) / math.sqrt(10), rel_tol=1e-3)
+    assert math.isclose(interval.width, interval.upper - interval.lower)
+
+
+def test_confidence_interval_is_infinite_for_a_single_value():
+    running_statistics = RunningStatistics()
+    running_statistics.add(1.0)
+    assert running_statistics.confidence_interval(0.95).half_width == math.inf
+
+
+def test_student_t_quantile():
+    assert math.isclose(student_t_quantile(0.975, 1), 12.706, rel_tol=1e-3)
+    assert math.isclose(student_t_quantile(0.975, 2), 4.303, rel_tol=1e-3)
+    assert math.isclose(student_t_quantile(0.975, 9), 2.262, rel_tol=1e-3)
+    assert math.isclose(student_t_quantile(0.975, 1000), 1.962, rel_tol=1e-3)
+
+
+def test_generate_process_info_data_is_deterministic():
+    parameters = WorkloadParameters(process_count=30, max_processing_time=8)
+
+    def as_tuples(process_info_data):
+        return [(info.pid, info.arrival_time, info.processing_time) for info in process_info_data]
+
+    first = as_tuples(generate_process_info_data(7, parameters))
+    assert first == as_tuples(generate_process_info_data(7, parameters))
+    assert first != as_tuples(generate_process_info_data(8, parameters))
+    assert len(first) == 30
+    assert all(1 <= processing_time <= 8 for _, _, processing_time in first)
+    assert [arrival_time for _, arrival_time, _ in first] == sorted(arrival_time for _, arrival_time, _ in first)
+
+
+def test_parallel_and_sequential_ensembles_match():
+    arguments = dict(
+        scheduler_type=RoundRobinScheduler,
+        scheduler_arguments={"time_quantum": 4},
+        target_width=1.0,
+        base_seed=3,
+    )
+    sequential = run_ensemble(worker_count=1, **arguments)
+    recorded_seeds = []
+    parallel = run_ensemble(
+        worker_count=4,
+        on_replica_finished=lambda seed, aggregates: recorded_seeds.append(seed),
+        **arguments
+    )
+    assert sequential.is_converged and parallel.is_converged
+    assert sorted(parallel.replicas) == list(range(3, 3 + sequential.replica_count))
+    assert recorded_seeds == sorted(parallel.replicas)
+    for seed, aggregates in sequential.replicas.items():
+        assert vars(parallel.replicas[seed]) == vars(aggregates)
+
+
+def test_ensemble_stops_at_max_replica_count_without_target():
+    result = run_ensemble(RoundRobinScheduler, max_replica_count=12, worker_count=1)
+    assert result.replica_count == 12
+    assert not result.is_converged
@@ -0,0 +1,9 @@
+import pytest
+
+from scheduler.round_robin_scheduler import RoundRobinScheduler
+
+
+@pytest.mark.parametrize("time_quantum", [0, -2])
+def test_time_quantum_must_be_at_least_one(time_quantum):
+    with pytest.raises(ValueError):
+        RoundRobinScheduler(time_quantum)